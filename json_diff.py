@@ -12,20 +12,94 @@ Dependencies: deepdiff (install with: pip install deepdiff)
 
 import json
 import sys
+import filecmp
 import os
-from typing import Dict, Any
+import re
+import functools
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from deepdiff import DeepDiff
+from deepdiff.helper import CannotCompare, NotPresent
+from deepdiff.model import TreeResult
+
+# Keys that identify a list item, in order of preference, when DeepDiff pairs
+# items of order-insensitive lists (see match_by_id)
+IDENTITY_KEYS = ('id', 'task_id', 'step_id')
+
+# Share of changed items from which id-aligned lists are compared position by
+# position (see needs_order_insensitive_match). Measured on 4000 id-aligned
+# tasks: with 10% changed, order-insensitive matching took 2.9s vs 4.0s
+# positional; at 20% both took 4.8s; at 50% it took 17.5s vs 7.6s.
+POSITIONAL_MATCH_MIN_CHANGED_RATIO = 0.2
+
+# Regex syntax that cannot be joined into a single alternation without changing
+# its meaning: global inline flags and references to numbered or named groups
+UNCOMBINABLE_REGEX_PATTERN = re.compile(r"\(\?[aiLmsux]+\)|\\[1-9]|\(\?P=|\(\?\(")
+
+# Entries in DeepDiff's internal memoization cache (0 disables it)
+DEEPDIFF_CACHE_SIZE = 5000
+
+# Diffs with more changes than this only print the summary (the full diff is
+# still exported). Override with the ZUORA_DIFF_MAX_PRINT environment variable.
+DEFAULT_MAX_PRINTED_CHANGES = 10_000
+
+class Change:
+    """A single difference: its DeepDiff path plus the old and new values."""
+    
+    # Slots instead of a per-change dict keeps large diffs compact in memory
+    __slots__ = ('path', 'old_value', 'new_value')
+    
+    def __init__(self, path: str, old_value: Any, new_value: Any):
+        self.path = path
+        self.old_value = old_value
+        self.new_value = new_value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the change to the dictionary layout used in JSON output.
+        
+        Returns:
+            Dict[str, Any]: The change with 'path', 'old_value' and 'new_value' keys
+        """
+        return {"path": self.path, "old_value": self.old_value, "new_value": self.new_value}
+
+
+def encode_change(obj: Any) -> Dict[str, Any]:
+    """
+    JSON encoder hook that serializes Change objects.
+    
+    Passed as ``default`` to json.dumps, so each change is only turned
+    into a dictionary while it is being written.
+    
+    Args:
+        obj (Any): The object the encoder could not serialize natively
+        
+    Returns:
+        Dict[str, Any]: The serializable form of the change
+        
+    Raises:
+        TypeError: If obj is not a Change
+    """
+    if isinstance(obj, Change):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 def print_usage() -> None:
     """
     Print usage information for the script.
     """
-    print("Usage: python json_diff.py <file1.json> <file2.json>")
+    print("Usage: python json_diff.py [--quiet] <file1.json> <file2.json> [exclusion_list.json]")
     print("\nDescription:")
     print("  Compare two JSON files and report differences in a structured format.")
-    print("\nExample:")
+    print("  Paths listed in the optional exclusion list are skipped during the comparison.")
+    print("\nOptions:")
+    print("  -q, --quiet, --summary-only  Print only the summary (diff_export.json is still written)")
+    print(f"  Diffs with more than ZUORA_DIFF_MAX_PRINT changes (default: {DEFAULT_MAX_PRINTED_CHANGES})")
+    print("  are summarized automatically.")
+    print("\nExamples:")
     print("  python json_diff.py sample1.json sample2.json")
+    print("  python json_diff.py samplefile1.json samplefile2.json exclusion.json")
     print("\nDependencies:")
     print("  pip install deepdiff")
 
@@ -46,24 +120,18 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
         PermissionError: If the file cannot be read due to permissions
     """
     try:
-        # Check if file exists
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Error: File '{file_path}' not found.")
-        
-        # Check if file is readable
-        if not os.access(file_path, os.R_OK):
-            raise PermissionError(f"Error: File '{file_path}' is not readable.")
-        
-        # Load and parse JSON
-        with open(file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
+        # Load and parse JSON (json.loads accepts the raw bytes, which skips a
+        # separate text decoding layer). open() itself reports missing or
+        # unreadable files, so there are no separate pre-checks.
+        with open(file_path, 'rb') as file:
+            data = json.loads(file.read())
             return data
             
-    except FileNotFoundError as e:
-        print(f"❌ {e}")
+    except FileNotFoundError:
+        print(f"❌ Error: File '{file_path}' not found.")
         sys.exit(1)
-    except PermissionError as e:
-        print(f"❌ {e}")
+    except PermissionError:
+        print(f"❌ Error: File '{file_path}' is not readable.")
         sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"❌ Error: Invalid JSON in file '{file_path}' at line {e.lineno}, column {e.colno}: {e.msg}")
@@ -73,33 +141,341 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
         sys.exit(1)
 
 
-def format_path(path: str) -> str:
+def encode_json(data: Any) -> bytes:
     """
-    Format a deepdiff path for better readability.
+    Serialize data as 2-space indented UTF-8 JSON.
+    
+    The output matches ``json.dump(data, indent=2, ensure_ascii=False)``,
+    including NaN and Infinity, which the reconstructors read back as such.
     
     Args:
-        path (str): The path string from deepdiff
+        data (Any): The data to serialize
         
     Returns:
-        str: Formatted path for display
+        bytes: The encoded JSON document
+    """
+    return json.dumps(data, indent=2, ensure_ascii=False, default=encode_change).encode('utf-8')
+
+
+def indent_json(data: Any, depth: int) -> bytes:
     """
-    # Remove 'root' prefix and format the path
-    if path.startswith("root"):
-        path = path[4:]  # Remove 'root'
+    Encode data with encode_json and indent it for nesting at the given depth.
     
-    # Replace array indices with more readable format
-    import re
-    path = re.sub(r"\[(\d+)\]", r"[\1]", path)
+    Args:
+        data (Any): The data to serialize
+        depth (int): Nesting depth of the value in the enclosing document
+        
+    Returns:
+        bytes: The encoded JSON, with continuation lines indented by 2 * depth spaces
+    """
+    # Encoded JSON strings never contain raw newlines, so this only touches layout
+    return encode_json(data).replace(b"\n", b"\n" + b"  " * depth)
+
+
+def write_diff_export(diff_export: Dict[str, Any], f) -> None:
+    """
+    Write the diff export to a binary file, streaming the changes one at a time.
     
-    return path if path else "root"
+    The output is identical to ``encode_json(diff_export)``, but only a single
+    change is encoded at any moment, so memory use does not grow with the
+    size of the serialized export.
+    
+    Args:
+        diff_export (Dict[str, Any]): The export with metadata, differences and summary
+        f: A file object opened in binary write mode
+    """
+    f.write(b"{")
+    for i, (key, value) in enumerate(diff_export.items()):
+        f.write(b",\n  " if i else b"\n  ")
+        f.write(encode_json(key) + b": ")
+        
+        if key != "differences" or not value or not all(isinstance(changes, list) for changes in value.values()):
+            f.write(indent_json(value, 1))
+            continue
+        
+        # Stream each change-type list element by element
+        f.write(b"{")
+        for j, (change_type, changes) in enumerate(value.items()):
+            f.write(b",\n    " if j else b"\n    ")
+            f.write(encode_json(change_type) + b": ")
+            if not changes:
+                f.write(b"[]")
+                continue
+            f.write(b"[")
+            for k, change in enumerate(changes):
+                f.write(b",\n      " if k else b"\n      ")
+                f.write(indent_json(change, 3))
+            f.write(b"\n    ]")
+        f.write(b"\n  }")
+    f.write(b"\n}")
 
 
-def export_diff_to_json(diff, file1_path: str, file2_path: str) -> None:
+def load_exclusions(exclusion_file_path: str) -> Dict[str, Any]:
     """
-    Export the diff object to a JSON file for programmatic access.
+    Load an exclusion list and convert it into DeepDiff exclusion arguments.
+    
+    The exclusion list uses the same format as the reconstructor's
+    (``excluded_paths`` and ``excluded_regex_paths``). Regex patterns are
+    validated and then compiled with compile_regex_paths, so DeepDiff
+    usually runs one search per path instead of one per pattern.
     
     Args:
-        diff: The DeepDiff object containing all differences (tuple for tree view)
+        exclusion_file_path (str): Path to the exclusion list JSON file
+        
+    Returns:
+        Dict[str, Any]: Keyword arguments for DeepDiff (``exclude_paths`` and
+        ``exclude_regex_paths``)
+    """
+    exclusion_list = load_json_file(exclusion_file_path)
+    
+    # Reject malformed lists up front instead of failing inside DeepDiff
+    if not isinstance(exclusion_list, dict):
+        print(f"❌ Error: Exclusion file '{exclusion_file_path}' must contain a JSON object.")
+        sys.exit(1)
+    for key in ('excluded_paths', 'excluded_regex_paths'):
+        values = exclusion_list.get(key, [])
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            print(f"❌ Error: '{key}' in exclusion file '{exclusion_file_path}' must be a list of strings.")
+            sys.exit(1)
+    
+    regex_paths = exclusion_list.get('excluded_regex_paths', [])
+    try:
+        for pattern in regex_paths:
+            re.compile(pattern)
+    except re.error as e:
+        print(f"❌ Error: Invalid regex in exclusion file '{exclusion_file_path}': {e}")
+        sys.exit(1)
+    
+    return {
+        "exclude_paths": set(exclusion_list.get('excluded_paths', [])),
+        "exclude_regex_paths": compile_regex_paths(regex_paths)
+    }
+
+
+def compile_regex_paths(regex_paths: List[str]) -> List[re.Pattern]:
+    """
+    Compile valid exclusion regex patterns, combining them into one alternation when that is safe.
+    
+    Global inline flags such as ``(?i)`` are rejected inside an alternation,
+    and group references (``\\1``, ``(?P=name)``, ``(?(1)...)``) would point
+    at other groups once the patterns are joined. If any pattern uses them,
+    or the joined pattern does not compile, the patterns are kept separate.
+    
+    Args:
+        regex_paths (List[str]): The regex pattern strings, already validated
+        
+    Returns:
+        List[re.Pattern]: The compiled patterns, for DeepDiff's ``exclude_regex_paths``
+    """
+    if len(regex_paths) > 1 and not any(UNCOMBINABLE_REGEX_PATTERN.search(pattern) for pattern in regex_paths):
+        try:
+            # One search over the alternation instead of one search per pattern
+            return [re.compile("|".join(f"(?:{pattern})" for pattern in regex_paths))]
+        except re.error:
+            pass
+    return [re.compile(pattern) for pattern in regex_paths]
+
+
+def files_identical(file1_path: str, file2_path: str) -> bool:
+    """
+    Check whether two files have byte-identical contents.
+    
+    Files of different sizes are rejected from their metadata alone; otherwise
+    the contents are compared block by block until the first difference.
+    
+    Args:
+        file1_path (str): Path to the first file
+        file2_path (str): Path to the second file
+        
+    Returns:
+        bool: True if both files have the same contents, False otherwise
+        (including when either file cannot be read)
+    """
+    try:
+        return filecmp.cmp(file1_path, file2_path, shallow=False)
+    except OSError:
+        # Let load_json_file report missing or unreadable files
+        return False
+
+
+def documents_identical(json1: Any, json2: Any) -> bool:
+    """
+    Check whether two parsed JSON documents are strictly identical.
+    
+    Unlike a plain ``==`` comparison, values must also have the same type
+    (``1``, ``1.0`` and ``true`` are different), mirroring how DeepDiff
+    reports type changes. Identical documents have no differences under any
+    DeepDiff setting, so the comparison can be skipped entirely.
+    
+    Args:
+        json1 (Any): The first parsed JSON document
+        json2 (Any): The second parsed JSON document
+        
+    Returns:
+        bool: True if both documents are identical, False otherwise
+    """
+    # Cheap C-level rejection first; only walk the tree when it might match
+    if json1 != json2:
+        return False
+    
+    def strict_equal(a: Any, b: Any) -> bool:
+        if type(a) is not type(b):
+            return False
+        if isinstance(a, dict):
+            return all(strict_equal(value, b[key]) for key, value in a.items())
+        if isinstance(a, list):
+            return all(strict_equal(x, y) for x, y in zip(a, b))
+        return True
+    
+    return strict_equal(json1, json2)
+
+
+def needs_order_insensitive_match(level) -> bool:
+    """
+    Decide whether DeepDiff should compare a list ignoring element order.
+    
+    Used as DeepDiff's ``ignore_order_func``. Order-insensitive matching
+    hashes every element, which pairs unchanged elements cheaply, but the
+    cost of pairing the changed ones grows quickly with their number. Lists
+    of objects whose ``id`` values appear in the same order on both sides
+    are already aligned, so when a large share of their elements changed
+    (POSITIONAL_MATCH_MIN_CHANGED_RATIO) they are compared position by
+    position instead. Every other list keeps the order-insensitive comparison.
+    
+    Args:
+        level: The DeepDiff level being compared
+        
+    Returns:
+        bool: True if the list needs order-insensitive matching, False otherwise
+    """
+    t1, t2 = level.t1, level.t2
+    if not isinstance(t1, list) or not isinstance(t2, list) or not t1 or len(t1) != len(t2):
+        return True
+    
+    try:
+        if [item['id'] for item in t1] != [item['id'] for item in t2]:
+            return True
+    except (KeyError, TypeError):
+        # At least one element is not an object with an 'id'
+        return True
+    
+    # Plain equality runs in C, so counting changed positions is cheap
+    changed = sum(1 for x, y in zip(t1, t2) if x != y)
+    return changed < len(t1) * POSITIONAL_MATCH_MIN_CHANGED_RATIO
+
+
+def materialize_tree(diff) -> Optional[Dict[str, List[Change]]]:
+    """
+    Convert a DeepDiff tree view into a serializable dictionary.
+    
+    The conversion is done once per comparison and the result is shared by
+    the console output and the JSON export.
+    
+    Args:
+        diff: The DeepDiff TreeResult containing all differences
+        
+    Returns:
+        Optional[Dict[str, List[Change]]]: Changes grouped by change type, or None
+        if the diff has an unexpected format
+    """
+    # Handle TreeResult object from DeepDiff tree view
+    if not (hasattr(diff, '__iter__') and hasattr(diff, 'items')):
+        return None
+    
+    tree_dict = {}
+    
+    # Handle different types of changes in the tree
+    for change_type, changes in diff.items():
+        # A TreeResult that did not come out of DeepDiff (the identical-documents
+        # fast path) still carries an empty list for every report type
+        if not changes:
+            continue
+        bucket = tree_dict[change_type] = []
+        for change in changes:
+            # Convert each change to a Change record, handling NotPresent objects
+            old_value = getattr(change, 't1', None)
+            new_value = getattr(change, 't2', None)
+            
+            # Convert NotPresent objects to a string representation
+            if isinstance(old_value, NotPresent):
+                old_value = "not present"
+            if isinstance(new_value, NotPresent):
+                new_value = "not present"
+            
+            # change.path() rebuilds the path string by walking the parent levels,
+            # so it is called exactly once per change
+            bucket.append(Change(str(change.path()), old_value, new_value))
+    
+    return tree_dict
+
+
+def pairing_keys(exclusions: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Return the identity keys that match_by_id may pair list items on.
+    
+    Excluded keys are left out: ids are often generated per environment,
+    which is why the exclusion lists drop them, so a different excluded id
+    must not force two items apart. DeepDiff does not tell the compare
+    function where the items live, so a key counts as excluded when any
+    exclusion path or regex mentions it.
+    
+    Args:
+        exclusions (Dict[str, Any]): DeepDiff exclusion arguments from load_exclusions()
+        
+    Returns:
+        Tuple[str, ...]: The usable keys from IDENTITY_KEYS, in order of preference
+    """
+    exclusion_texts = list(exclusions.get('exclude_paths', ()))
+    exclusion_texts.extend(pattern.pattern for pattern in exclusions.get('exclude_regex_paths', ()))
+    return tuple(
+        key for key in IDENTITY_KEYS
+        if not any(re.search(rf"(?<!\w){key}(?!\w)", text, re.IGNORECASE) for text in exclusion_texts)
+    )
+
+
+def match_by_id(x: Any, y: Any, level=None, identity_keys: Tuple[str, ...] = IDENTITY_KEYS) -> bool:
+    """
+    Pair list items that carry the same identifying key.
+    
+    Used as DeepDiff's ``iterable_compare_func``. When DeepDiff pairs up the
+    items left over after order-insensitive hash matching, it asks this
+    function about every candidate pair before computing deep distances.
+    Items that both carry one of ``identity_keys`` are matched on the first
+    such key alone: equal keys pair the items and different keys rule the
+    pair out, so neither needs a deep distance. Only pairs without a shared
+    identifying key raise CannotCompare and go through DeepDiff's
+    distance-based pairing.
+    
+    Args:
+        x (Any): An item from the first list
+        y (Any): An item from the second list
+        level: The DeepDiff level, passed only when a list is compared in order
+        identity_keys (Tuple[str, ...]): Keys to pair on, see pairing_keys()
+        
+    Returns:
+        bool: True if both items have the same identifying key, False if it differs
+        
+    Raises:
+        CannotCompare: If the items do not share an identifying key
+    """
+    # Lists compared in order are already aligned by id (see
+    # needs_order_insensitive_match), so keep DeepDiff's positional matching
+    if level is not None:
+        raise CannotCompare()
+    
+    if isinstance(x, dict) and isinstance(y, dict):
+        for key in identity_keys:
+            if key in x and key in y:
+                return x[key] == y[key]
+    raise CannotCompare()
+
+
+def export_diff_to_json(tree_dict: Optional[Dict[str, List[Change]]], file1_path: str, file2_path: str) -> None:
+    """
+    Export the differences to a JSON file for programmatic access.
+    
+    Args:
+        tree_dict: The differences as returned by materialize_tree
         file1_path (str): Path to the first JSON file
         file2_path (str): Path to the second JSON file
     """
@@ -114,44 +490,21 @@ def export_diff_to_json(diff, file1_path: str, file2_path: str) -> None:
         "differences": {}
     }
     
-    # Handle TreeResult object from DeepDiff tree view
-    if hasattr(diff, '__iter__') and hasattr(diff, 'items'):
-        # Set has_differences flag - check if there are any changes
-        has_changes = any(len(changes) > 0 for changes in diff.values())
-        diff_export["metadata"]["has_differences"] = has_changes
+    if tree_dict is not None:
+        # Count the changes once; the flag and the summary are derived from it
+        change_types = {change_type: len(changes) for change_type, changes in tree_dict.items()}
+        total_changes = sum(change_types.values())
         
-        # Convert TreeResult to a serializable format
-        tree_dict = {}
-        
-        # Handle different types of changes in the tree
-        for change_type, changes in diff.items():
-            tree_dict[change_type] = []
-            for change in changes:
-                # Convert each change to a dictionary, handling NotPresent objects
-                old_value = getattr(change, 't1', None)
-                new_value = getattr(change, 't2', None)
-                
-                # Convert NotPresent objects to a string representation
-                if hasattr(old_value, '__class__') and 'NotPresent' in str(type(old_value)):
-                    old_value = "not present"
-                if hasattr(new_value, '__class__') and 'NotPresent' in str(type(new_value)):
-                    new_value = "not present"
-                
-                change_dict = {
-                    "path": str(change.path()),
-                    "old_value": old_value,
-                    "new_value": new_value
-                }
-                tree_dict[change_type].append(change_dict)
+        # Set has_differences flag - check if there are any changes
+        diff_export["metadata"]["has_differences"] = total_changes > 0
         
         # Store the tree view structure
         diff_export["differences"] = tree_dict
         
         # Add summary statistics
-        total_changes = sum(len(changes) for changes in tree_dict.values())
         diff_export["summary"] = {
             "total_changes": total_changes,
-            "change_types": {change_type: len(changes) for change_type, changes in tree_dict.items()}
+            "change_types": change_types
         }
         
     else:
@@ -163,68 +516,68 @@ def export_diff_to_json(diff, file1_path: str, file2_path: str) -> None:
     # Write to JSON file
     output_file = "diff_export.json"
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(diff_export, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            write_diff_export(diff_export, f)
         print(f"📄 Diff exported to: {output_file}")
     except Exception as e:
         print(f"⚠️  Warning: Could not export diff to JSON file: {e}")
 
 
-def print_differences(diff) -> None:
+def get_max_printed_changes() -> int:
+    """
+    Get the largest number of changes that is printed in full.
+    
+    Returns:
+        int: The value of ZUORA_DIFF_MAX_PRINT, or the default if it is unset or invalid
+    """
+    try:
+        return int(os.environ.get("ZUORA_DIFF_MAX_PRINT", DEFAULT_MAX_PRINTED_CHANGES))
+    except ValueError:
+        return DEFAULT_MAX_PRINTED_CHANGES
+
+
+def print_differences(tree_dict: Optional[Dict[str, List[Change]]], summary_only: bool = False) -> None:
     """
     Print the differences in a structured, human-readable format.
     
     Args:
-        diff: The DeepDiff object containing all differences (tuple for tree view)
+        tree_dict: The differences as returned by materialize_tree
+        summary_only (bool): Print only the summary, not the tree structure
     """
     print("=" * 80)
     print("📊 JSON COMPARISON RESULTS (TREE VIEW)")
     print("=" * 80)
     
-    # Handle TreeResult object from DeepDiff tree view
-    if hasattr(diff, '__iter__') and hasattr(diff, 'items'):
+    if tree_dict is not None:
         # Check if there are any differences
-        if not diff:
+        if not tree_dict:
             print("✅ No differences found. The JSON files are identical.")
             return
         
-        # Convert TreeResult to a serializable format
-        tree_dict = {}
-        
-        # Handle different types of changes in the tree
-        for change_type, changes in diff.items():
-            tree_dict[change_type] = []
-            for change in changes:
-                # Convert each change to a dictionary, handling NotPresent objects
-                old_value = getattr(change, 't1', None)
-                new_value = getattr(change, 't2', None)
-                
-                # Convert NotPresent objects to a string representation
-                if hasattr(old_value, '__class__') and 'NotPresent' in str(type(old_value)):
-                    old_value = "not present"
-                if hasattr(new_value, '__class__') and 'NotPresent' in str(type(new_value)):
-                    new_value = "not present"
-                
-                change_dict = {
-                    "path": str(change.path()),
-                    "old_value": old_value,
-                    "new_value": new_value
-                }
-                tree_dict[change_type].append(change_dict)
-        
-        # Display the tree structure
-        print("\n🌳 TREE VIEW STRUCTURE:")
-        print("-" * 60)
-        print(json.dumps(tree_dict, indent=4, sort_keys=True, ensure_ascii=False))
-        print()
-        
         # Calculate summary
         total_changes = sum(len(changes) for changes in tree_dict.values())
         
+        max_printed_changes = get_max_printed_changes()
+        if summary_only or total_changes > max_printed_changes:
+            # Rendering huge diffs costs far more than computing them
+            print()
+            if not summary_only:
+                print(f"ℹ️  Tree view skipped: more than {max_printed_changes} changes "
+                      "(set ZUORA_DIFF_MAX_PRINT to raise the limit).")
+            print("   See diff_export.json for the full list of changes.")
+            print()
+        else:
+            # Display the tree structure
+            print("\n🌳 TREE VIEW STRUCTURE:")
+            print("-" * 60)
+            # Stream straight to stdout instead of building the whole string first;
+            # keys keep the export's order (path, old_value, new_value)
+            json.dump(tree_dict, sys.stdout, indent=4, ensure_ascii=False, default=encode_change)
+            print("\n")
+        
     else:
         # Fallback for unexpected format
         print("⚠️  Warning: Unexpected tree view format.")
-        print(f"⚠️  Actual type: {type(diff)}")
         return
     
     # Print summary
@@ -233,43 +586,89 @@ def print_differences(diff) -> None:
     print("=" * 80)
 
 
-def compare_json_files(file1_path: str, file2_path: str) -> None:
+def compute_diff(json1: Any, json2: Any, exclusions: Dict[str, Any],
+                 identical: bool = False) -> Optional[Dict[str, List[Change]]]:
+    """
+    Compute the differences between two parsed JSON documents.
+    
+    This is the single place the diff backend is invoked; callers only see
+    the materialized ``{change_type: [Change, ...]}`` mapping, which is the
+    format the display, the export and both reconstructors rely on.
+    
+    Args:
+        json1 (Any): The first parsed document
+        json2 (Any): The second parsed document
+        exclusions (Dict[str, Any]): DeepDiff exclusion arguments from load_exclusions()
+        identical (bool): True when the inputs are already known to be identical
+        
+    Returns:
+        Optional[Dict[str, List[Change]]]: Changes grouped by change type
+    """
+    if identical or documents_identical(json1, json2):
+        # Nothing to report, so skip DeepDiff's traversal and hashing
+        tree_view = TreeResult()
+    else:
+        diff = DeepDiff(
+            json1,
+            json2,
+            ignore_order_func=needs_order_insensitive_match,
+            iterable_compare_func=functools.partial(match_by_id, identity_keys=pairing_keys(exclusions)),
+            # Memoize distance/hash lookups for repeated sub-objects (similar task records)
+            cache_size=DEEPDIFF_CACHE_SIZE,
+            cache_tuning_sample_size=0,
+            **exclusions
+        )
+        
+        # Get tree view representation
+        tree_view = diff.tree
+    
+    # Convert the tree view once and share it between the display and the export
+    return materialize_tree(tree_view)
+
+
+def compare_json_files(file1_path: str, file2_path: str, exclusion_file_path: str = None,
+                       summary_only: bool = False) -> None:
     """
     Compare two JSON files and display the differences.
     
     Args:
         file1_path (str): Path to the first JSON file
         file2_path (str): Path to the second JSON file
+        exclusion_file_path (str, optional): Path to an exclusion list whose paths
+            are skipped during the comparison
+        summary_only (bool): Print only the summary instead of every change
     """
     print(f"🔍 Comparing JSON files:")
     print(f"   File 1: {file1_path}")
     print(f"   File 2: {file2_path}")
+    if exclusion_file_path:
+        print(f"   Exclusions: {exclusion_file_path}")
     print()
     
-    # Load both JSON files
+    # Byte-identical files cannot differ: parse one copy (which still validates
+    # the JSON) and skip both the second parse and the comparison
+    identical_files = files_identical(file1_path, file2_path)
+    
     try:
         json1 = load_json_file(file1_path)
-        json2 = load_json_file(file2_path)
+        json2 = json1 if identical_files else load_json_file(file2_path)
     except Exception:
         # Error handling is done in load_json_file
         return
     
-    # Perform the comparison using deepdiff
+    # Excluded subtrees are never traversed by DeepDiff; load_exclusions reports
+    # its own errors, so it stays outside the handler above
+    exclusions = load_exclusions(exclusion_file_path) if exclusion_file_path else {}
+    
+    # Perform the comparison
     try:
-        diff = DeepDiff(
-            json1,
-            json2,
-            ignore_order=True
-        )
-        
-        # Get tree view representation
-        tree_view = diff.tree
+        tree_dict = compute_diff(json1, json2, exclusions, identical_files)
         
         # Display the results
-        print_differences(tree_view)
+        print_differences(tree_dict, summary_only)
         
         # Export diff to JSON file
-        export_diff_to_json(tree_view, file1_path, file2_path)
+        export_diff_to_json(tree_dict, file1_path, file2_path)
         
     except Exception as e:
         print(f"❌ Error during comparison: {e}")
@@ -280,16 +679,22 @@ def main() -> None:
     """
     Main function to handle command-line arguments and initiate comparison.
     """
-    # Check for correct number of arguments
-    if len(sys.argv) != 3:
+    # Separate option flags from the file arguments
+    summary_flags = {"-q", "--quiet", "--summary-only"}
+    summary_only = any(arg in summary_flags for arg in sys.argv[1:])
+    args = [arg for arg in sys.argv[1:] if arg not in summary_flags]
+    
+    # Check for correct number of arguments (2 required, 1 optional)
+    if len(args) < 2 or len(args) > 3:
         print("❌ Error: Incorrect number of arguments.")
         print()
         print_usage()
         sys.exit(1)
     
     # Extract file paths
-    file1_path = sys.argv[1]
-    file2_path = sys.argv[2]
+    file1_path = args[0]
+    file2_path = args[1]
+    exclusion_file_path = args[2] if len(args) == 3 else None
     
     # Validate that both arguments are provided
     if not file1_path or not file2_path:
@@ -299,7 +704,7 @@ def main() -> None:
         sys.exit(1)
     
     # Perform the comparison
-    compare_json_files(file1_path, file2_path)
+    compare_json_files(file1_path, file2_path, exclusion_file_path, summary_only)
 
 
 if __name__ == "__main__":
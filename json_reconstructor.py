@@ -14,29 +14,147 @@ Author: Generated for Zuora Workflow Automation
 
 import json
 import sys
+import functools
 import re
-import copy
 import argparse
-from typing import Any, Dict, List, Union, Set
+from typing import Any, Dict, List, Union, Set, Tuple
 from pathlib import Path
 
+# Matches one bracketed segment of a DeepDiff path, e.g. ['tasks'] or [0]
+PATH_SEGMENT_PATTERN = re.compile(r"\[([^\]]+)\]")
+# Matches paths like root['key'][index] that replace an entire object
+OBJECT_LEVEL_PATTERN = re.compile(r"root\[[^\]]+\]\[\d+\]$")
+# Regex syntax that cannot be joined into a single alternation without changing
+# its meaning: global inline flags and references to numbered or named groups
+UNCOMBINABLE_REGEX_PATTERN = re.compile(r"\(\?[aiLmsux]+\)|\\[1-9]|\(\?P=|\(\?\(")
+
+@functools.lru_cache(maxsize=4096)
+def parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    """
+    Parse a DeepDiff path string into a tuple of keys/indices.
+    
+    Results are cached, since the same path is often parsed more than once
+    (e.g. object-level changes with excluded fields); the tuple is immutable
+    so callers cannot corrupt the cached value.
+    
+    Args:
+        path: The path string (e.g., "root['tasks'][0]['name']")
+        
+    Returns:
+        Tuple of keys and indices to navigate the JSON structure
+    """
+    # Remove 'root' prefix and parse the path
+    if path.startswith("root"):
+        path = path[4:]  # Remove 'root'
+    
+    # Parse the path using regex to handle both string keys and numeric indices
+    matches = PATH_SEGMENT_PATTERN.findall(path)
+    
+    result = []
+    for match in matches:
+        # Dispatch on the first character so string keys, the common case,
+        # skip the numeric check entirely
+        first = match[0]
+        if first in "'\"" and match.endswith(first):
+            # Quoted key: remove the quotes
+            result.append(match[1:-1])
+        elif first == '-' or first.isdigit():
+            # Numeric index (including negative numbers)
+            try:
+                result.append(int(match))
+            except ValueError:
+                result.append(match)
+        else:
+            result.append(match)
+    
+    return tuple(result)
+
+
 class JSONReconstructor:
     """Handles the reconstruction of JSON files from DeepDiff exports."""
     
-    def __init__(self, target_data: Dict, diff_export: Dict, exclusion_list: Dict):
+    # All attributes are set in __init__; slots avoid a per-instance __dict__
+    __slots__ = (
+        'target_data',
+        'diff_export',
+        'exclusion_list',
+        'verbose',
+        'excluded_paths',
+        'excluded_prefixes',
+        'excluded_regex_paths',
+        'compiled_regex_paths',
+        'excludes_object_fields',
+    )
+    
+    def __init__(self, target_data: Dict, diff_export: Dict, exclusion_list: Dict, verbose: bool = False):
         """
         Initialize the reconstructor with the required data.
         
         Args:
-            target_data: The original JSON data
+            target_data: The original JSON data; it is modified in place, so pass
+                a copy if the caller still needs the unmodified data
             diff_export: The DeepDiff export containing changes
             exclusion_list: The exclusion list with paths to ignore
+            verbose: Print every applied, skipped and preserved path; errors are always printed
         """
-        self.target_data = copy.deepcopy(target_data)
+        self.target_data = target_data
         self.diff_export = diff_export
         self.exclusion_list = exclusion_list
+        self.verbose = verbose
         self.excluded_paths = set(exclusion_list.get('excluded_paths', []))
+        self.excluded_prefixes = self.build_excluded_prefixes(self.excluded_paths)
         self.excluded_regex_paths = exclusion_list.get('excluded_regex_paths', [])
+        self.compiled_regex_paths = self.compile_regex_paths(self.excluded_regex_paths)
+        self.excludes_object_fields = self.has_excluded_object_fields()
+        
+    @staticmethod
+    def build_excluded_prefixes(excluded_paths: Set[str]) -> Tuple[str, ...]:
+        """
+        Build the prefixes that mark a path as nested under an excluded path.
+        
+        Args:
+            excluded_paths: The excluded paths
+            
+        Returns:
+            Tuple of prefixes, usable directly with str.startswith
+        """
+        return tuple(
+            excluded_path + separator
+            for excluded_path in excluded_paths
+            for separator in ('[', '.')
+        )
+    
+    @staticmethod
+    def compile_regex_paths(regex_paths: List[str]) -> List[re.Pattern]:
+        """
+        Compile the exclusion regex patterns, skipping invalid ones.
+        
+        The valid patterns are joined into a single alternation unless one of
+        them uses global inline flags or group references, which do not
+        survive being joined, or the joined pattern fails to compile.
+        
+        Args:
+            regex_paths: The raw regex pattern strings
+            
+        Returns:
+            List of compiled patterns (a single one when they could be joined)
+        """
+        valid_patterns = []
+        for regex_pattern in regex_paths:
+            try:
+                re.compile(regex_pattern)
+            except re.error:
+                # If regex is invalid, skip it
+                continue
+            valid_patterns.append(regex_pattern)
+        
+        if len(valid_patterns) > 1 and not any(UNCOMBINABLE_REGEX_PATTERN.search(regex_pattern) for regex_pattern in valid_patterns):
+            try:
+                # One search over the alternation instead of one search per pattern
+                return [re.compile("|".join(f"(?:{regex_pattern})" for regex_pattern in valid_patterns))]
+            except re.error:
+                pass
+        return [re.compile(regex_pattern) for regex_pattern in valid_patterns]
         
     def is_path_excluded(self, path: str) -> bool:
         """
@@ -53,58 +171,34 @@ class JSONReconstructor:
             return True
             
         # Check if any parent path is excluded (for task-level changes)
-        for excluded_path in self.excluded_paths:
-            if path.startswith(excluded_path + '[') or path.startswith(excluded_path + '.'):
-                return True
+        if path.startswith(self.excluded_prefixes):
+            return True
             
         # Check regex pattern matches
-        for regex_pattern in self.excluded_regex_paths:
-            try:
-                if re.search(regex_pattern, path):
-                    return True
-            except re.error:
-                # If regex is invalid, skip it
-                continue
+        if any(pattern.search(path) for pattern in self.compiled_regex_paths):
+            return True
                 
         return False
     
-    def parse_path(self, path: str) -> List[Union[str, int]]:
+    def parse_path(self, path: str) -> Tuple[Union[str, int], ...]:
         """
-        Parse a DeepDiff path string into a list of keys/indices.
+        Parse a DeepDiff path string into a tuple of keys/indices.
         
         Args:
             path: The path string (e.g., "root['tasks'][0]['name']")
             
         Returns:
-            List of keys and indices to navigate the JSON structure
+            Tuple of keys and indices to navigate the JSON structure
         """
-        # Remove 'root' prefix and parse the path
-        if path.startswith("root"):
-            path = path[4:]  # Remove 'root'
-        
-        # Parse the path using regex to handle both string keys and numeric indices
-        pattern = r"\[([^\]]+)\]"
-        matches = re.findall(pattern, path)
-        
-        result = []
-        for match in matches:
-            # Check if it's a numeric index (including negative numbers)
-            if match.lstrip('-').isdigit():
-                result.append(int(match))
-            else:
-                # Remove quotes and add the key
-                key = match.strip("'\"")
-                result.append(key)
-        
-        return result
+        return parse_path(path)
     
-    def get_nested_value(self, data: Dict, path_keys: List[Union[str, int]]) -> Any:
+    def get_nested_value(self, data: Dict, path_keys: Tuple[Union[str, int], ...]) -> Any:
         """
         Get a value from nested data structure using path keys.
         
         Args:
             data: The data structure to navigate
-            path_keys: List of keys/indices to navigate
+            path_keys: Keys/indices to navigate, as returned by parse_path
             
         Returns:
             The value at the specified path
@@ -119,17 +213,31 @@ class JSONReconstructor:
                 raise ValueError(f"Cannot navigate to key {key} in {type(current)}")
         return current
     
-    def set_nested_value(self, data: Dict, path_keys: List[Union[str, int]], value: Any) -> None:
+    def resolve_container(self, data: Dict, parent_keys: Tuple[Union[str, int], ...]) -> Any:
         """
-        Set a value in nested data structure using path keys.
+        Navigate to a container, creating missing intermediate containers.
         
         Args:
             data: The data structure to modify
-            path_keys: List of keys/indices to navigate
-            value: The value to set
+            parent_keys: Keys/indices of the container, as returned by parse_path
+            
+        Returns:
+            The container at the specified path
         """
+        # Fast path: the container usually exists already, so try plain indexing
+        # first. Indexing a string only yields another string, so ending on a dict
+        # or list means every step went through an existing container.
+        try:
+            current = data
+            for key in parent_keys:
+                current = current[key]
+            if isinstance(current, (dict, list)):
+                return current
+        except (KeyError, IndexError, TypeError):
+            pass
+        
         current = data
-        for key in path_keys[:-1]:
+        for key in parent_keys:
             if isinstance(current, dict):
                 if key not in current:
                     current[key] = {}
@@ -140,44 +248,78 @@ class JSONReconstructor:
                 current = current[key]
             else:
                 raise ValueError(f"Cannot navigate to key {key} in {type(current)}")
+        return current
+    
+    def set_child_value(self, container: Any, final_key: Union[str, int], value: Any) -> None:
+        """
+        Set a value directly inside a container, growing lists as needed.
         
-        # Set the final value
-        final_key = path_keys[-1]
-        if isinstance(current, dict):
-            current[final_key] = value
-        elif isinstance(current, list):
-            while len(current) <= final_key:
-                current.append(None)
-            current[final_key] = value
+        Args:
+            container: The dictionary or list to modify
+            final_key: The key or index to set
+            value: The value to set
+        """
+        if isinstance(container, dict):
+            container[final_key] = value
+        elif isinstance(container, list):
+            while len(container) <= final_key:
+                container.append(None)
+            container[final_key] = value
         else:
-            raise ValueError(f"Cannot set value at key {final_key} in {type(current)}")
+            raise ValueError(f"Cannot set value at key {final_key} in {type(container)}")
     
-    def apply_values_changed(self, changes: List[Dict]) -> None:
+    def group_changes_by_parent(self, changes: List[Dict]) -> Dict[Tuple[Union[str, int], ...], List[Tuple[str, Tuple[Union[str, int], ...], Dict]]]:
         """
-        Apply values_changed modifications to the reconstructed data.
+        Drop excluded changes and group the rest by the path of their parent container.
         
         Args:
-            changes: List of value change objects from DeepDiff
+            changes: List of change objects from DeepDiff
+            
+        Returns:
+            Mapping of parent path keys to (path, path_keys, change) tuples, in diff order
         """
+        groups = {}
         for change in changes:
             path = change['path']
             
             if self.is_path_excluded(path):
-                print(f"Skipping excluded path: {path}")
+                if self.verbose:
+                    print(f"Skipping excluded path: {path}")
                 continue
             
-            try:
-                path_keys = self.parse_path(path)
-                new_value = change['new_value']
-                
-                # Check if this is an object-level change that might have excluded fields
-                if self.is_object_level_change(path) and self.has_excluded_object_fields():
-                    new_value = self.apply_selective_object_update(path, new_value)
-                
-                self.set_nested_value(self.target_data, path_keys, new_value)
-                print(f"Applied values_changed: {path}")
-            except Exception as e:
-                print(f"Error applying values_changed for {path}: {e}")
+            path_keys = self.parse_path(path)
+            groups.setdefault(path_keys[:-1], []).append((path, path_keys, change))
+        return groups
+    
+    def apply_values_changed(self, changes: List[Dict]) -> None:
+        """
+        Apply values_changed modifications to the reconstructed data.
+        
+        Args:
+            changes: List of value change objects from DeepDiff
+        """
+        for parent_keys, group in self.group_changes_by_parent(changes).items():
+            # Descend to the shared parent once, on first use
+            container = None
+            for path, path_keys, change in group:
+                try:
+                    new_value = change['new_value']
+                    
+                    # Check if this is an object-level change that might have excluded fields
+                    if self.excludes_object_fields and self.is_object_level_change(path):
+                        # The object must already exist, so look it up without creating anything
+                        if container is None:
+                            container = self.get_nested_value(self.target_data, parent_keys)
+                        current_value = self.get_nested_value(container, path_keys[-1:])
+                        new_value = self.apply_selective_object_update(path, new_value, current_value)
+                    
+                    if container is None:
+                        container = self.resolve_container(self.target_data, parent_keys)
+                    self.set_child_value(container, path_keys[-1], new_value)
+                    if self.verbose:
+                        print(f"Applied values_changed: {path}")
+                except Exception as e:
+                    print(f"Error applying values_changed for {path}: {e}")
     
     def apply_dictionary_item_added(self, changes: List[Dict]) -> None:
         """
@@ -186,20 +328,18 @@ class JSONReconstructor:
         Args:
             changes: List of dictionary item addition objects from DeepDiff
         """
-        for change in changes:
-            path = change['path']
-            
-            if self.is_path_excluded(path):
-                print(f"Skipping excluded path: {path}")
-                continue
-            
-            try:
-                path_keys = self.parse_path(path)
-                new_value = change.get('new_value', change.get('value'))
-                self.set_nested_value(self.target_data, path_keys, new_value)
-                print(f"Applied dictionary_item_added: {path}")
-            except Exception as e:
-                print(f"Error applying dictionary_item_added for {path}: {e}")
+        for parent_keys, group in self.group_changes_by_parent(changes).items():
+            container = None
+            for path, path_keys, change in group:
+                try:
+                    new_value = change.get('new_value', change.get('value'))
+                    if container is None:
+                        container = self.resolve_container(self.target_data, parent_keys)
+                    self.set_child_value(container, path_keys[-1], new_value)
+                    if self.verbose:
+                        print(f"Applied dictionary_item_added: {path}")
+                except Exception as e:
+                    print(f"Error applying dictionary_item_added for {path}: {e}")
     
     def apply_dictionary_item_removed(self, changes: List[Dict]) -> None:
         """
@@ -208,27 +348,23 @@ class JSONReconstructor:
         Args:
             changes: List of dictionary item removal objects from DeepDiff
         """
-        for change in changes:
-            path = change['path']
-            
-            if self.is_path_excluded(path):
-                print(f"Skipping excluded path: {path}")
-                continue
-            
-            try:
-                path_keys = self.parse_path(path)
-                parent_keys = path_keys[:-1]
-                key_to_remove = path_keys[-1]
-                
-                parent = self.get_nested_value(self.target_data, parent_keys)
-                if isinstance(parent, dict):
-                    del parent[key_to_remove]
-                elif isinstance(parent, list):
-                    parent.pop(key_to_remove)
-                
-                print(f"Applied dictionary_item_removed: {path}")
-            except Exception as e:
-                print(f"Error applying dictionary_item_removed for {path}: {e}")
+        for parent_keys, group in self.group_changes_by_parent(changes).items():
+            parent = None
+            for path, path_keys, change in group:
+                try:
+                    key_to_remove = path_keys[-1]
+                    
+                    if parent is None:
+                        parent = self.get_nested_value(self.target_data, parent_keys)
+                    if isinstance(parent, dict):
+                        del parent[key_to_remove]
+                    elif isinstance(parent, list):
+                        parent.pop(key_to_remove)
+                    
+                    if self.verbose:
+                        print(f"Applied dictionary_item_removed: {path}")
+                except Exception as e:
+                    print(f"Error applying dictionary_item_removed for {path}: {e}")
     
     def apply_iterable_item_added(self, changes: List[Dict]) -> None:
         """
@@ -237,20 +373,18 @@ class JSONReconstructor:
         Args:
             changes: List of iterable item addition objects from DeepDiff
         """
-        for change in changes:
-            path = change['path']
-            
-            if self.is_path_excluded(path):
-                print(f"Skipping excluded path: {path}")
-                continue
-            
-            try:
-                path_keys = self.parse_path(path)
-                new_value = change['value']
-                self.set_nested_value(self.target_data, path_keys, new_value)
-                print(f"Applied iterable_item_added: {path}")
-            except Exception as e:
-                print(f"Error applying iterable_item_added for {path}: {e}")
+        for parent_keys, group in self.group_changes_by_parent(changes).items():
+            container = None
+            for path, path_keys, change in group:
+                try:
+                    new_value = change['value']
+                    if container is None:
+                        container = self.resolve_container(self.target_data, parent_keys)
+                    self.set_child_value(container, path_keys[-1], new_value)
+                    if self.verbose:
+                        print(f"Applied iterable_item_added: {path}")
+                except Exception as e:
+                    print(f"Error applying iterable_item_added for {path}: {e}")
     
     def apply_iterable_item_removed(self, changes: List[Dict]) -> None:
         """
@@ -259,25 +393,26 @@ class JSONReconstructor:
         Args:
             changes: List of iterable item removal objects from DeepDiff
         """
-        for change in changes:
-            path = change['path']
+        for parent_keys, group in self.group_changes_by_parent(changes).items():
+            # DeepDiff reports indices of the original list, so remove the highest
+            # index first; otherwise each pop would shift the items still to be removed
+            group.sort(key=lambda item: item[1][-1] if item[1] and isinstance(item[1][-1], int) else -1,
+                       reverse=True)
             
-            if self.is_path_excluded(path):
-                print(f"Skipping excluded path: {path}")
-                continue
-            
-            try:
-                path_keys = self.parse_path(path)
-                parent_keys = path_keys[:-1]
-                index_to_remove = path_keys[-1]
-                
-                parent = self.get_nested_value(self.target_data, parent_keys)
-                if isinstance(parent, list):
-                    parent.pop(index_to_remove)
-                
-                print(f"Applied iterable_item_removed: {path}")
-            except Exception as e:
-                print(f"Error applying iterable_item_removed for {path}: {e}")
+            parent = None
+            for path, path_keys, change in group:
+                try:
+                    index_to_remove = path_keys[-1]
+                    
+                    if parent is None:
+                        parent = self.get_nested_value(self.target_data, parent_keys)
+                    if isinstance(parent, list):
+                        parent.pop(index_to_remove)
+                    
+                    if self.verbose:
+                        print(f"Applied iterable_item_removed: {path}")
+                except Exception as e:
+                    print(f"Error applying iterable_item_removed for {path}: {e}")
     
     def reconstruct(self) -> Dict:
         """
@@ -318,7 +453,7 @@ class JSONReconstructor:
         """
         # Match patterns like root['key'][index] or root['key']['subkey'][index]
         # This detects when entire objects are being replaced
-        return re.match(r"root\[[^\]]+\]\[\d+\]$", path) is not None
+        return OBJECT_LEVEL_PATTERN.match(path) is not None
     
     def has_excluded_object_fields(self) -> bool:
         """
@@ -335,39 +470,33 @@ class JSONReconstructor:
                 return True
         return False
     
-    def apply_selective_object_update(self, path: str, new_value: Dict) -> Dict:
+    def apply_selective_object_update(self, path: str, new_value: Dict, current_value: Any) -> Dict:
         """
         Apply selective updates to an object, preserving excluded fields.
         
         Args:
             path: The path of the object being updated
             new_value: The new object value
+            current_value: The object currently at the path
             
         Returns:
             The selectively updated object value
         """
-        # Get the current object value
-        path_keys = self.parse_path(path)
-        current_value = self.get_nested_value(self.target_data, path_keys)
-        
-        # Create a copy of the new value
-        updated_value = copy.deepcopy(new_value)
+        # Only top-level fields are reassigned below, so a shallow copy is enough
+        field_items = new_value.items()
+        updated_value = dict(field_items)
         
         # Check each field in the new value against exclusion patterns
-        for field_name, field_value in new_value.items():
+        for field_name, field_value in field_items:
             field_path = f"{path}['{field_name}']"
             
             # Check if this field should be excluded
-            for regex_pattern in self.excluded_regex_paths:
-                try:
-                    if re.search(regex_pattern, field_path):
-                        # Preserve the original field value
-                        if isinstance(current_value, dict) and field_name in current_value:
-                            updated_value[field_name] = current_value[field_name]
-                            print(f"Preserved excluded field: {field_path}")
-                        break
-                except re.error:
-                    continue
+            if any(pattern.search(field_path) for pattern in self.compiled_regex_paths):
+                # Preserve the original field value
+                if isinstance(current_value, dict) and field_name in current_value:
+                    updated_value[field_name] = current_value[field_name]
+                    if self.verbose:
+                        print(f"Preserved excluded field: {field_path}")
         
         return updated_value
 
@@ -386,12 +515,15 @@ def load_json_file(file_path: str) -> Dict:
         FileNotFoundError: If the file doesn't exist
         json.JSONDecodeError: If the file contains invalid JSON
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    # open() reports a missing file itself; only the message is rewritten
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
     
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # json.loads accepts the raw bytes, which skips a separate text decoding layer
+    with f:
+        return json.loads(f.read())
 
 
 def save_json_file(data: Dict, file_path: str) -> None:
@@ -425,7 +557,7 @@ Examples:
     parser.add_argument('-o', '--output', default='reconstructed.json',
                        help='Output file path (default: reconstructed.json)')
     parser.add_argument('-v', '--verbose', action='store_true',
-                       help='Enable verbose output')
+                       help='Enable verbose output, including every applied, skipped and preserved path')
     
     args = parser.parse_args()
     
@@ -443,7 +575,7 @@ Examples:
         
         # Create reconstructor and apply changes
         print("Reconstructing JSON...")
-        reconstructor = JSONReconstructor(target_data, diff_export, exclusion_list)
+        reconstructor = JSONReconstructor(target_data, diff_export, exclusion_list, args.verbose)
         reconstructed_data = reconstructor.reconstruct()
         
         # Save the reconstructed data
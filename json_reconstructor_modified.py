@@ -10,17 +10,20 @@ Dependencies: None (uses only standard library)
 """
 
 import json
-import copy
+import functools
+import re
 import sys
-import os
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple, Union
+
+# Matches each ['key'] or [index] segment of a DeepDiff path
+PATH_SEGMENT_PATTERN = re.compile(r"\[([^\]]+)\]")
 
 
 def print_usage() -> None:
     """
     Print usage information for the script.
     """
-    print("Usage: python json_reconstructor.py <original_file.json> <diff_file.json> <output_file.json> [target_file.json]")
+    print("Usage: python json_reconstructor.py [--verbose] [--compact] <original_file.json> <diff_file.json> <output_file.json> [target_file.json]")
     print("\nDescription:")
     print("  Reconstruct a modified JSON file from an original file and a diff export.")
     print("  The diff export should contain the actual values for all changes.")
@@ -29,19 +32,22 @@ def print_usage() -> None:
     print("  diff_file.json      - The JSON file containing the processed diff export")
     print("  output_file.json    - The output file for the reconstructed JSON")
     print("  target_file.json    - (Optional) The target file for extracting addition values (fallback)")
+    print("\nOptions:")
+    print("  -v, --verbose       - Print every applied change instead of only per-pass counts")
+    print("  --compact           - Write the output without indentation (smaller and faster to write)")
     print("\nExamples:")
     print("  python json_reconstructor.py zuora_workflow1.json diff_export.json reconstructed.json")
     print("  python json_reconstructor.py zuora_workflow1.json diff_export.json reconstructed.json zuora_workflow2.json")
 
 
-def preserve_excluded_fields(reconstructed_data: Dict[str, Any], original_data: Dict[str, Any], excluded_fields: List[str]) -> Dict[str, Any]:
+def preserve_excluded_fields(reconstructed_data: Dict[str, Any], original_data: Dict[str, Any], excluded_fields: FrozenSet[str]) -> Dict[str, Any]:
     """
     Preserve excluded fields from original data in the reconstructed data.
     
     Args:
         reconstructed_data: The reconstructed JSON data
         original_data: The original JSON data with all fields
-        excluded_fields: List of field names that were excluded during diff
+        excluded_fields: Set of field names that were excluded during diff
         
     Returns:
         Dict[str, Any]: Reconstructed data with excluded fields preserved
@@ -49,42 +55,55 @@ def preserve_excluded_fields(reconstructed_data: Dict[str, Any], original_data:
     if not isinstance(reconstructed_data, dict) or not isinstance(original_data, dict):
         return reconstructed_data
     
-    # Create a deep copy to avoid modifying the original
-    result = copy.deepcopy(reconstructed_data)
-    
-    # Recursively preserve excluded fields while maintaining original key order
-    def preserve_recursive(recon_obj, orig_obj):
+    # Walk both documents with an explicit stack instead of recursion, so deeply
+    # nested workflows cannot hit the recursion limit. Each entry names the
+    # output container and slot that the merged value belongs in; slots are
+    # reserved with a placeholder first so the original key order is kept.
+    root = [None]
+    stack = [(reconstructed_data, original_data, root, 0)]
+    while stack:
+        recon_obj, orig_obj, parent, slot = stack.pop()
         if isinstance(recon_obj, dict) and isinstance(orig_obj, dict):
             # Create a new ordered dictionary that maintains the original key order
             new_obj = {}
+            parent[slot] = new_obj
             
             # First, add all keys from original in their original order
-            for key in orig_obj.keys():
+            for key, orig_value in orig_obj.items():
                 if key in recon_obj:
-                    # Key exists in both, recursively process it
-                    new_obj[key] = preserve_recursive(recon_obj[key], orig_obj[key])
+                    recon_value = recon_obj[key]
+                    if isinstance(recon_value, (dict, list)):
+                        # Nested container, process it once its slot is reserved
+                        new_obj[key] = None
+                        stack.append((recon_value, orig_value, new_obj, key))
+                    else:
+                        new_obj[key] = recon_value
                 elif key in excluded_fields:
                     # Key was excluded, add it from original
-                    new_obj[key] = copy.deepcopy(orig_obj[key])
+                    new_obj[key] = copy_json_data(orig_value)
                 # If key is not in recon_obj and not excluded, skip it (it was removed)
             
             # Then add any new keys from reconstructed that weren't in original
-            for key in recon_obj.keys():
+            for key, recon_value in recon_obj.items():
                 if key not in orig_obj:
-                    new_obj[key] = copy.deepcopy(recon_obj[key])
-            
-            return new_obj
+                    new_obj[key] = copy_json_data(recon_value)
         elif isinstance(recon_obj, list) and isinstance(orig_obj, list):
-            # For lists, process each item recursively
-            result_list = []
-            for i, (recon_item, orig_item) in enumerate(zip(recon_obj, orig_obj)):
-                result_list.append(preserve_recursive(recon_item, orig_item))
-            return result_list
+            # For lists, process each item pairwise
+            pairs = list(zip(recon_obj, orig_obj))
+            result_list = [None] * len(pairs)
+            parent[slot] = result_list
+            for i, (recon_item, orig_item) in enumerate(pairs):
+                if isinstance(recon_item, (dict, list)):
+                    stack.append((recon_item, orig_item, result_list, i))
+                else:
+                    result_list[i] = recon_item
         else:
-            # For primitive values, return the reconstructed value
-            return recon_obj
+            # For primitive values, keep the reconstructed value
+            parent[slot] = recon_obj
     
-    return preserve_recursive(result, original_data)
+    # The walk builds new containers and never modifies its inputs,
+    # so the reconstructed data does not need to be copied first
+    return root[0]
 
 
 def load_json_file(file_path: str) -> Dict[str, Any]:
@@ -103,24 +122,19 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
         PermissionError: If the file cannot be read due to permissions
     """
     try:
-        # Check if file exists
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Error: File '{file_path}' not found.")
-        
-        # Check if file is readable
-        if not os.access(file_path, os.R_OK):
-            raise PermissionError(f"Error: File '{file_path}' is not readable.")
-        
-        # Load and parse JSON
-        with open(file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
+        # Load and parse JSON (open() itself reports missing or unreadable
+        # files, so there are no separate pre-checks). json.loads accepts the
+        # raw bytes, which skips a separate text decoding layer. The standard
+        # library keeps integers wider than 64 bits exact, unlike orjson.
+        with open(file_path, 'rb') as file:
+            data = json.loads(file.read())
             return data
             
-    except FileNotFoundError as e:
-        print(f"❌ {e}")
+    except FileNotFoundError:
+        print(f"❌ Error: File '{file_path}' not found.")
         sys.exit(1)
-    except PermissionError as e:
-        print(f"❌ {e}")
+    except PermissionError:
+        print(f"❌ Error: File '{file_path}' is not readable.")
         sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"❌ Error: Invalid JSON in file '{file_path}' at line {e.lineno}, column {e.colno}: {e.msg}")
@@ -130,15 +144,65 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
         sys.exit(1)
 
 
-def parse_path(path: str) -> List[Union[str, int]]:
+def save_json_file(data: Any, file_path: str, compact: bool = False) -> None:
+    """
+    Write JSON data to a file.
+    
+    Args:
+        data: The data to save
+        file_path (str): Path where to save the file
+        compact (bool): Skip indentation and whitespace, for machine-consumed output
+    """
+    if compact:
+        # Without indentation json.dumps runs the C encoder in one shot, which is
+        # much faster than json.dump's chunked writes; write the bytes directly
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with open(file_path, 'wb') as f:
+            f.write(payload)
+        return
+    
+    # Indented output goes through the pure-Python encoder either way, so
+    # stream it to keep peak memory flat
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, ensure_ascii=False, separators=(',', ': '))
+
+
+def copy_json_data(data: Any) -> Any:
     """
-    Parse a DeepDiff path string into a list of keys/indices for navigation.
+    Deep copy parsed JSON data.
+    
+    JSON data only contains dicts, lists and immutable scalars, so only the
+    containers need copying; this avoids copy.deepcopy's per-node dispatch
+    and memo bookkeeping.
+    
+    Args:
+        data: The parsed JSON data to copy
+        
+    Returns:
+        An independent copy of the data
+    """
+    data_type = type(data)
+    if data_type is dict:
+        return {key: copy_json_data(value) for key, value in data.items()}
+    if data_type is list:
+        return [copy_json_data(item) for item in data]
+    # Strings, numbers, booleans and None are immutable
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    """
+    Parse a DeepDiff path string into a tuple of keys/indices for navigation.
+    
+    Results are cached, since the same paths (and the parents of array
+    items) are parsed repeatedly across the apply passes.
     
     Args:
         path (str): Path string like "root['key']['subkey'][0]"
         
     Returns:
-        List[Union[str, int]]: List of keys and indices for navigation
+        Tuple[Union[str, int], ...]: Keys and indices for navigation
     """
     # Remove 'root' prefix if present
     if path.startswith("root"):
@@ -146,39 +210,38 @@ def parse_path(path: str) -> List[Union[str, int]]:
     
     # Handle empty path (root only)
     if not path:
-        return []
-    
-    # Parse the path using a simple approach
-    import re
+        return ()
     
     # Find all ['key'] and [index] patterns
-    pattern = r"\[([^\]]+)\]"
-    matches = re.findall(pattern, path)
+    matches = PATH_SEGMENT_PATTERN.findall(path)
     
     result = []
     for match in matches:
-        # Try to convert to integer (for array indices)
-        try:
-            result.append(int(match))
-        except ValueError:
-            # Remove quotes if present
-            if match.startswith("'") and match.endswith("'"):
-                result.append(match[1:-1])
-            elif match.startswith('"') and match.endswith('"'):
-                result.append(match[1:-1])
-            else:
+        # Dispatch on the first character so string keys, the common case,
+        # never go through a failed int() conversion
+        first = match[0]
+        if first in "'\"" and match.endswith(first):
+            # Quoted key: remove the quotes
+            result.append(match[1:-1])
+        elif first == '-' or first.isdigit():
+            # Array index
+            try:
+                result.append(int(match))
+            except ValueError:
                 result.append(match)
+        else:
+            result.append(match)
     
-    return result
+    return tuple(result)
 
 
-def navigate_to_path(data: Dict[str, Any], path: List[Union[str, int]]) -> Any:
+def navigate_to_path(data: Dict[str, Any], path: Tuple[Union[str, int], ...]) -> Any:
     """
     Navigate to a specific path in the data structure.
     
     Args:
         data: The data structure to navigate
-        path: List of keys/indices to follow
+        path: Keys/indices to follow, as returned by parse_path
         
     Returns:
         The value at the specified path
@@ -188,85 +251,146 @@ def navigate_to_path(data: Dict[str, Any], path: List[Union[str, int]]) -> Any:
         IndexError: If an array index is out of bounds
     """
     current = data
-    for key in path:
-        if isinstance(current, dict):
-            current = current[key]
-        elif isinstance(current, list):
+    try:
+        # Dictionaries and lists are both indexed with [], so no type dispatch is needed
+        for key in path:
             current = current[key]
-        else:
-            raise KeyError(f"Cannot navigate to key '{key}' in non-container type")
+    except TypeError:
+        if isinstance(current, (dict, list)):
+            raise
+        raise KeyError(f"Cannot navigate to key '{key}' in non-container type") from None
     return current
 
 
-def set_value_at_path(data: Dict[str, Any], path: List[Union[str, int]], value: Any) -> None:
+def ensure_list_index(items: List[Any], index: int) -> None:
     """
-    Set a value at a specific path in the data structure.
+    Pad a list with None so that the given index exists.
+    
+    Args:
+        items: The list to grow
+        index: The index that must be valid afterwards
+    """
+    missing = index + 1 - len(items)
+    if missing > 0:
+        items.extend([None] * missing)
+
+
+def resolve_parent(data: Dict[str, Any], parent_path: Tuple[Union[str, int], ...]) -> Any:
+    """
+    Navigate to a container, creating missing intermediate containers.
     
     Args:
         data: The data structure to modify
-        path: List of keys/indices to follow
-        value: The value to set
+        parent_path: Keys/indices of the container, as returned by parse_path
+        
+    Returns:
+        The container at the specified path
     """
     current = data
-    # Navigate to the parent of the target
-    for key in path[:-1]:
-        if isinstance(current, dict):
-            if key not in current:
-                # Create intermediate dictionaries as needed
-                current[key] = {}
+    for key in parent_path:
+        # Fast path: the intermediate container already exists
+        try:
             current = current[key]
+            continue
+        except (KeyError, IndexError, TypeError):
+            pass
+        
+        if isinstance(current, dict):
+            # Create intermediate dictionaries as needed
+            current[key] = {}
         elif isinstance(current, list):
-            # Ensure list is large enough
-            while len(current) <= key:
-                current.append(None)
-            current = current[key]
+            ensure_list_index(current, key)
         else:
             raise KeyError(f"Cannot navigate to key '{key}' in non-container type")
+        current = current[key]
+    return current
+
+
+def set_child_value(container: Any, key: Union[str, int], value: Any) -> None:
+    """
+    Set a value directly inside a container, growing lists as needed.
     
-    # Set the final value
-    final_key = path[-1]
-    if isinstance(current, dict):
-        current[final_key] = value
-    elif isinstance(current, list):
-        # Ensure list is large enough
-        while len(current) <= final_key:
-            current.append(None)
-        current[final_key] = value
-    else:
-        raise KeyError(f"Cannot set value in non-container type")
+    Args:
+        container: The dictionary or list to modify
+        key: The key or index to set
+        value: The value to set
+    """
+    # Dictionaries and in-range list slots take a plain assignment
+    try:
+        container[key] = value
+        return
+    except IndexError:
+        pass
+    except TypeError:
+        if isinstance(container, (dict, list)):
+            raise
+        raise KeyError(f"Cannot set value in non-container type") from None
+    
+    # Only lists that are too short get here
+    ensure_list_index(container, key)
+    container[key] = value
 
 
-def remove_value_at_path(data: Dict[str, Any], path: List[Union[str, int]]) -> None:
+def group_by_parent(entries: List[Dict[str, Any]]) -> Dict[Optional[Tuple[Union[str, int], ...]], List[Tuple[Dict[str, Any], Any]]]:
     """
-    Remove a value at a specific path in the data structure.
+    Group diff entries by the path of the container they modify.
+    
+    Entries that share a parent (e.g. several keys of the same object) can
+    then be applied after navigating to that parent only once. Groups keep
+    the order in which their parents first appear.
+    
+    Entries whose path cannot be parsed are grouped under None, paired with
+    the parsing error instead of a path, so the caller can report and skip
+    them one by one.
     
     Args:
-        data: The data structure to modify
-        path: List of keys/indices to follow
+        entries: Diff entries with a 'path' key
+        
+    Returns:
+        Mapping of parent path to the (entry, parsed path) pairs under it
     """
-    current = data
-    # Navigate to the parent of the target
-    for key in path[:-1]:
-        if isinstance(current, dict):
-            current = current[key]
-        elif isinstance(current, list):
-            current = current[key]
-        else:
-            raise KeyError(f"Cannot navigate to key '{key}' in non-container type")
+    groups = {}
+    for entry in entries:
+        try:
+            path = parse_path(entry['path']) if 'path' in entry else ()
+        except Exception as e:
+            groups.setdefault(None, []).append((entry, e))
+            continue
+        groups.setdefault(path[:-1], []).append((entry, path))
+    return groups
+
+
+def remove_child_value(container: Any, key: Union[str, int]) -> None:
+    """
+    Remove a value directly from a container; missing keys are ignored.
     
-    # Remove the final value
-    final_key = path[-1]
-    if isinstance(current, dict):
-        if final_key in current:
-            del current[final_key]
-    elif isinstance(current, list):
-        if 0 <= final_key < len(current):
-            del current[final_key]
+    Args:
+        container: The dictionary or list to modify
+        key: The key or index to remove
+    """
+    if isinstance(container, dict):
+        # A single lookup; a key that is already gone is not an error
+        container.pop(key, None)
+    elif isinstance(container, list):
+        if 0 <= key < len(container):
+            del container[key]
     else:
         raise KeyError(f"Cannot remove value from non-container type")
 
 
-def apply_dictionary_item_added(data: Dict[str, Any], additions: List[Dict[str, Any]], target_data: Dict[str, Any] = None) -> None:
+def print_apply_summary(applied: int, skipped: int) -> None:
+    """
+    Print the result line for one apply pass.
+    
+    Args:
+        applied: Number of diff entries that were applied
+        skipped: Number of diff entries that could not be applied
+    """
+    print(f"  • {applied} applied, {skipped} skipped")
+
+
+def apply_dictionary_item_added(data: Dict[str, Any], additions: List[Dict[str, Any]], target_data: Dict[str, Any] = None,
+                                verbose: bool = False) -> None:
     """
     Apply dictionary item additions to the data.
     
@@ -274,85 +398,127 @@ def apply_dictionary_item_added(data: Dict[str, Any], additions: List[Dict[str,
         data: The data structure to modify
         additions: List of addition objects with 'path' and 'new_value' keys
         target_data: Optional target data to extract values from (fallback)
+        verbose: Print a line for every applied entry
     """
     print("🟢 Applying dictionary item additions...")
-    for addition in additions:
-        try:
-            path_str = addition['path']
-            new_value = addition['new_value']
-            
-            # Use the new_value from the diff, or fallback to target_data
-            if new_value == "not present" and target_data:
-                path = parse_path(path_str)
-                new_value = navigate_to_path(target_data, path)
-            
-            path = parse_path(path_str)
-            set_value_at_path(data, path, new_value)
-            print(f"  • Added: {path_str}")
-        except Exception as e:
-            print(f"  ⚠️  Warning: Could not apply addition at {addition.get('path', 'unknown')}: {e}")
-
-
-def apply_dictionary_item_removed(data: Dict[str, Any], removals: List[Dict[str, Any]]) -> None:
+    applied = skipped = 0
+    for parent_path, group in group_by_parent(additions).items():
+        # Navigate to the shared parent once, on first use
+        container = None
+        for addition, path in group:
+            try:
+                if parent_path is None:
+                    raise path
+                new_value = addition['new_value']
+                
+                # Use the new_value from the diff, or fallback to target_data
+                if new_value == "not present" and target_data:
+                    new_value = navigate_to_path(target_data, path)
+                
+                if container is None:
+                    container = resolve_parent(data, parent_path)
+                set_child_value(container, path[-1], new_value)
+                applied += 1
+                if verbose:
+                    print(f"  • Added: {addition['path']}")
+            except Exception as e:
+                skipped += 1
+                print(f"  ⚠️  Warning: Could not apply addition at {addition.get('path', 'unknown')}: {e}")
+    print_apply_summary(applied, skipped)
+
+
+def apply_dictionary_item_removed(data: Dict[str, Any], removals: List[Dict[str, Any]], verbose: bool = False) -> None:
     """
     Apply dictionary item removals to the data.
     
     Args:
         data: The data structure to modify
         removals: List of removal objects with 'path' key
+        verbose: Print a line for every applied entry
     """
     print("🔴 Applying dictionary item removals...")
-    for removal in removals:
-        try:
-            path_str = removal['path']
-            path = parse_path(path_str)
-            remove_value_at_path(data, path)
-            print(f"  • Removed: {path_str}")
-        except Exception as e:
-            print(f"  ⚠️  Warning: Could not remove item at {removal.get('path', 'unknown')}: {e}")
-
-
-def apply_values_changed(data: Dict[str, Any], changes: List[Dict[str, Any]]) -> None:
+    applied = skipped = 0
+    for parent_path, group in group_by_parent(removals).items():
+        # Navigate to the shared parent once, on first use
+        container = None
+        for removal, path in group:
+            try:
+                if parent_path is None:
+                    raise path
+                if container is None:
+                    container = navigate_to_path(data, parent_path)
+                remove_child_value(container, path[-1])
+                applied += 1
+                if verbose:
+                    print(f"  • Removed: {removal['path']}")
+            except Exception as e:
+                skipped += 1
+                print(f"  ⚠️  Warning: Could not remove item at {removal.get('path', 'unknown')}: {e}")
+    print_apply_summary(applied, skipped)
+
+
+def apply_values_changed(data: Dict[str, Any], changes: List[Dict[str, Any]], verbose: bool = False) -> None:
     """
     Apply value changes to the data.
     
     Args:
         data: The data structure to modify
         changes: List of change objects with 'path', 'old_value', and 'new_value' keys
+        verbose: Print a line for every applied entry
     """
     print("🟡 Applying value changes...")
-    for change in changes:
-        try:
-            path_str = change['path']
-            new_value = change['new_value']
-            path = parse_path(path_str)
-            set_value_at_path(data, path, new_value)
-            print(f"  • Changed: {path_str}")
-        except Exception as e:
-            print(f"  ⚠️  Warning: Could not change value at {change.get('path', 'unknown')}: {e}")
-
-
-def apply_type_changes(data: Dict[str, Any], type_changes: List[Dict[str, Any]]) -> None:
+    applied = skipped = 0
+    for parent_path, group in group_by_parent(changes).items():
+        # Navigate to the shared parent once, on first use
+        container = None
+        for change, path in group:
+            try:
+                if parent_path is None:
+                    raise path
+                if container is None:
+                    container = resolve_parent(data, parent_path)
+                set_child_value(container, path[-1], change['new_value'])
+                applied += 1
+                if verbose:
+                    print(f"  • Changed: {change['path']}")
+            except Exception as e:
+                skipped += 1
+                print(f"  ⚠️  Warning: Could not change value at {change.get('path', 'unknown')}: {e}")
+    print_apply_summary(applied, skipped)
+
+
+def apply_type_changes(data: Dict[str, Any], type_changes: List[Dict[str, Any]], verbose: bool = False) -> None:
     """
     Apply type changes to the data.
     
     Args:
         data: The data structure to modify
         type_changes: List of type change objects with 'path', 'old_value', 'new_value', 'old_type', 'new_type' keys
+        verbose: Print a line for every applied entry
     """
     print("🔄 Applying type changes...")
-    for change in type_changes:
-        try:
-            path_str = change['path']
-            new_value = change['new_value']
-            path = parse_path(path_str)
-            set_value_at_path(data, path, new_value)
-            print(f"  • Type changed: {path_str} ({change.get('old_type', 'unknown')} -> {change.get('new_type', 'unknown')})")
-        except Exception as e:
-            print(f"  ⚠️  Warning: Could not apply type change at {change.get('path', 'unknown')}: {e}")
-
-
-def apply_iterable_changes(data: Dict[str, Any], additions: List[Dict[str, Any]], removals: List[Dict[str, Any]]) -> None:
+    applied = skipped = 0
+    for parent_path, group in group_by_parent(type_changes).items():
+        # Navigate to the shared parent once, on first use
+        container = None
+        for change, path in group:
+            try:
+                if parent_path is None:
+                    raise path
+                if container is None:
+                    container = resolve_parent(data, parent_path)
+                set_child_value(container, path[-1], change['new_value'])
+                applied += 1
+                if verbose:
+                    print(f"  • Type changed: {change['path']} ({change.get('old_type', 'unknown')} -> {change.get('new_type', 'unknown')})")
+            except Exception as e:
+                skipped += 1
+                print(f"  ⚠️  Warning: Could not apply type change at {change.get('path', 'unknown')}: {e}")
+    print_apply_summary(applied, skipped)
+
+
+def apply_iterable_changes(data: Dict[str, Any], additions: List[Dict[str, Any]], removals: List[Dict[str, Any]],
+                           verbose: bool = False) -> None:
     """
     Apply iterable (array) changes to the data.
     
@@ -360,58 +526,88 @@ def apply_iterable_changes(data: Dict[str, Any], additions: List[Dict[str, Any]]
         data: The data structure to modify
         additions: List of addition objects with 'path' and 'new_value' keys
         removals: List of removal objects with 'path' and 'old_value' keys
+        verbose: Print a line for every applied entry
     """
     print("🟢 Applying array additions...")
-    for addition in additions:
-        try:
-            path_str = addition['path']
-            new_value = addition['new_value']
-            path = parse_path(path_str)
-            
-            # For array additions, we need to insert at the specific index
-            if len(path) > 0 and isinstance(path[-1], int):
-                # Insert at specific index
-                current = navigate_to_path(data, path[:-1])
-                if isinstance(current, list):
-                    index = path[-1]
-                    # Ensure the list is large enough
-                    while len(current) <= index:
-                        current.append(None)
-                    current[index] = new_value
-                    print(f"  • Added to array at index {index}: {path_str}")
+    applied = skipped = 0
+    for parent_path, group in group_by_parent(additions).items():
+        # Navigate to the shared parent once, on first use
+        current = None
+        for addition, path in group:
+            try:
+                if parent_path is None:
+                    raise path
+                path_str = addition['path']
+                new_value = addition['new_value']
+                
+                # For array additions, we need to insert at the specific index
+                if len(path) > 0 and isinstance(path[-1], int):
+                    # Insert at specific index
+                    if current is None:
+                        current = navigate_to_path(data, parent_path)
+                    if isinstance(current, list):
+                        index = path[-1]
+                        ensure_list_index(current, index)
+                        current[index] = new_value
+                        applied += 1
+                        if verbose:
+                            print(f"  • Added to array at index {index}: {path_str}")
+                    else:
+                        skipped += 1
+                        print(f"  ⚠️  Warning: Path {path_str} does not point to a list")
                 else:
-                    print(f"  ⚠️  Warning: Path {path_str} does not point to a list")
-            else:
-                print(f"  ⚠️  Warning: Invalid array path format: {path_str}")
-        except Exception as e:
-            print(f"  ⚠️  Warning: Could not add to array at {addition.get('path', 'unknown')}: {e}")
+                    skipped += 1
+                    print(f"  ⚠️  Warning: Invalid array path format: {path_str}")
+            except Exception as e:
+                skipped += 1
+                print(f"  ⚠️  Warning: Could not add to array at {addition.get('path', 'unknown')}: {e}")
+    print_apply_summary(applied, skipped)
     
     print("🔴 Applying array removals...")
-    for removal in removals:
-        try:
-            path_str = removal['path']
-            old_value = removal['old_value']
-            path = parse_path(path_str)
-            
-            # For array removals, we need to remove from the list
-            if len(path) > 0 and isinstance(path[-1], int):
-                current = navigate_to_path(data, path[:-1])
-                if isinstance(current, list):
-                    index = path[-1]
-                    if 0 <= index < len(current):
-                        del current[index]
-                        print(f"  • Removed from array at index {index}: {path_str}")
+    applied = skipped = 0
+    for parent_path, group in group_by_parent(removals).items():
+        # The indices refer to positions in the original list. Collect them and
+        # rebuild the list once, instead of shifting its tail on every deletion.
+        removed_indices = set()
+        # Navigate to the shared parent once, on first use
+        current = None
+        for removal, path in group:
+            try:
+                if parent_path is None:
+                    raise path
+                path_str = removal['path']
+                
+                # For array removals, we need to remove from the list
+                if len(path) > 0 and isinstance(path[-1], int):
+                    if current is None:
+                        current = navigate_to_path(data, parent_path)
+                    if isinstance(current, list):
+                        index = path[-1]
+                        if 0 <= index < len(current):
+                            removed_indices.add(index)
+                            applied += 1
+                            if verbose:
+                                print(f"  • Removed from array at index {index}: {path_str}")
+                        else:
+                            skipped += 1
+                            print(f"  ⚠️  Warning: Index {index} out of bounds for {path_str}")
                     else:
-                        print(f"  ⚠️  Warning: Index {index} out of bounds for {path_str}")
+                        skipped += 1
+                        print(f"  ⚠️  Warning: Path {path_str} does not point to a list")
                 else:
-                    print(f"  ⚠️  Warning: Path {path_str} does not point to a list")
-            else:
-                print(f"  ⚠️  Warning: Invalid array path format: {path_str}")
-        except Exception as e:
-            print(f"  ⚠️  Warning: Could not remove from array at {removal.get('path', 'unknown')}: {e}")
-
-
-def reconstruct_json(original_file_path: str, diff_file_path: str, output_file_path: str, target_file_path: str = None) -> None:
+                    skipped += 1
+                    print(f"  ⚠️  Warning: Invalid array path format: {path_str}")
+            except Exception as e:
+                skipped += 1
+                print(f"  ⚠️  Warning: Could not remove from array at {removal.get('path', 'unknown')}: {e}")
+        if removed_indices:
+            # Slice assignment keeps the same list object in place
+            current[:] = [item for i, item in enumerate(current) if i not in removed_indices]
+    print_apply_summary(applied, skipped)
+
+
+def reconstruct_json(original_file_path: str, diff_file_path: str, output_file_path: str, target_file_path: str = None,
+                     verbose: bool = False, compact: bool = False) -> None:
     """
     Reconstruct a modified JSON file from an original file and a diff export.
     
@@ -420,6 +616,8 @@ def reconstruct_json(original_file_path: str, diff_file_path: str, output_file_p
         diff_file_path (str): Path to the diff export JSON file
         output_file_path (str): Path for the output reconstructed JSON file
         target_file_path (str, optional): Path to the target file for extracting addition values
+        verbose (bool): Print every applied diff entry instead of only per-pass counts
+        compact (bool): Write the output without indentation or extra whitespace
     """
     print("🔧 JSON Reconstruction Tool")
     print("=" * 50)
@@ -438,73 +636,75 @@ def reconstruct_json(original_file_path: str, diff_file_path: str, output_file_p
     print("📖 Loading diff export data...")
     diff_data = load_json_file(diff_file_path)
     
-    # Load target data if provided
-    target_data = None
-    if target_file_path:
-        print("📖 Loading target JSON data...")
-        target_data = load_json_file(target_file_path)
-    
     # Validate diff structure
     if 'differences' not in diff_data:
         print("❌ Error: Invalid diff file structure. Missing 'differences' key.")
         sys.exit(1)
     
-    # Create a deep copy of the original data
-    print("📋 Creating working copy of original data...")
-    working_data = copy.deepcopy(original_data)
-    
     # Get the differences
     differences = diff_data['differences']
     
     # Check if there are any differences to apply
     if not differences:
         print("✅ No differences found. Original and target files are identical.")
-        # Still save the copy
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            json.dump(working_data, f, indent=4, ensure_ascii=False)
+        # Still save the copy (nothing is modified, so no working copy is needed)
+        save_json_file(original_data, output_file_path, compact)
         print(f"💾 Saved identical copy to: {output_file_path}")
         return
     
+    # Create a deep copy of the original data (the original is still needed to
+    # preserve excluded fields)
+    print("📋 Creating working copy of original data...")
+    working_data = copy_json_data(original_data)
+    
     print(f"🔍 Found {len(differences)} types of differences to apply...")
     print()
     
     # Apply dictionary item removals first (to avoid path issues)
     if 'dictionary_item_removed' in differences:
-        apply_dictionary_item_removed(working_data, differences['dictionary_item_removed'])
+        apply_dictionary_item_removed(working_data, differences['dictionary_item_removed'], verbose)
         print()
     
     # Apply value changes
     if 'values_changed' in differences:
-        apply_values_changed(working_data, differences['values_changed'])
+        apply_values_changed(working_data, differences['values_changed'], verbose)
         print()
     
     # Apply type changes
     if 'type_changes' in differences:
-        apply_type_changes(working_data, differences['type_changes'])
+        apply_type_changes(working_data, differences['type_changes'], verbose)
         print()
     
     # Apply iterable changes
     if 'iterable_item_added' in differences or 'iterable_item_removed' in differences:
         additions = differences.get('iterable_item_added', {})
         removals = differences.get('iterable_item_removed', {})
-        apply_iterable_changes(working_data, additions, removals)
+        apply_iterable_changes(working_data, additions, removals, verbose)
         print()
     
     # Apply dictionary item additions last (to avoid path conflicts)
     if 'dictionary_item_added' in differences:
-        apply_dictionary_item_added(working_data, differences['dictionary_item_added'], target_data)
+        additions = differences['dictionary_item_added']
+        
+        # The target file is only a fallback for additions whose value was not
+        # exported, so it is only loaded when such an addition exists
+        target_data = None
+        if target_file_path and any(addition.get('new_value') == "not present" for addition in additions):
+            print("📖 Loading target JSON data...")
+            target_data = load_json_file(target_file_path)
+        
+        apply_dictionary_item_added(working_data, additions, target_data, verbose)
         print()
     
     # Preserve excluded fields from original data
     print("🔧 Preserving excluded fields from original data...")
-    excluded_fields = ['id', 'task_id', 'files', 'created_tags']
+    excluded_fields = frozenset(('id', 'task_id', 'files', 'created_tags'))
     working_data = preserve_excluded_fields(working_data, original_data, excluded_fields)
     
     # Save the reconstructed data
     print("💾 Saving reconstructed JSON...")
     try:
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            json.dump(working_data, f, indent=4, ensure_ascii=False, separators=(',', ': '))
+        save_json_file(working_data, output_file_path, compact)
         print(f"✅ Successfully saved reconstructed JSON to: {output_file_path}")
     except Exception as e:
         print(f"❌ Error saving reconstructed JSON: {e}")
@@ -518,18 +718,25 @@ def main() -> None:
     """
     Main function to handle command-line arguments and initiate reconstruction.
     """
+    # Separate option flags from the file arguments
+    verbose_flags = {"-v", "--verbose"}
+    compact_flags = {"--compact"}
+    verbose = any(arg in verbose_flags for arg in sys.argv[1:])
+    compact = any(arg in compact_flags for arg in sys.argv[1:])
+    args = [arg for arg in sys.argv[1:] if arg not in verbose_flags | compact_flags]
+    
     # Check for correct number of arguments (3 required, 1 optional)
-    if len(sys.argv) < 4 or len(sys.argv) > 5:
+    if len(args) < 3 or len(args) > 4:
         print("❌ Error: Incorrect number of arguments.")
         print()
         print_usage()
         sys.exit(1)
     
     # Extract file paths
-    original_file_path = sys.argv[1]
-    diff_file_path = sys.argv[2]
-    output_file_path = sys.argv[3]
-    target_file_path = sys.argv[4] if len(sys.argv) == 5 else None
+    original_file_path = args[0]
+    diff_file_path = args[1]
+    output_file_path = args[2]
+    target_file_path = args[3] if len(args) == 4 else None
     
     # Validate that required arguments are provided
     if not all([original_file_path, diff_file_path, output_file_path]):
@@ -539,7 +746,7 @@ def main() -> None:
         sys.exit(1)
     
     # Perform the reconstruction
-    reconstruct_json(original_file_path, diff_file_path, output_file_path, target_file_path)
+    reconstruct_json(original_file_path, diff_file_path, output_file_path, target_file_path, verbose, compact)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,43 @@
+"""
+Regression tests for json_diff.py.
+
+Run with ``make test`` (pytest) or ``python -m unittest test_json_diff``.
+"""
+
+import copy
+import os
+import unittest
+
+import json_diff
+
+EXCLUSION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'exclusion.json')
+
+
+class ExcludedIdPairingTest(unittest.TestCase):
+    """Items whose ids are excluded must still be paired by their content."""
+
+    def test_reordered_tasks_with_regenerated_ids(self):
+        workflow1 = {
+            "tasks": [
+                {"id": 100 + i, "task_id": 200 + i, "name": f"Task {i}", "action_type": "Export", "x": i}
+                for i in range(6)
+            ]
+        }
+        # Reverse the tasks, regenerate their ids and change a single field
+        workflow2 = copy.deepcopy(workflow1)
+        workflow2["tasks"].reverse()
+        for task in workflow2["tasks"]:
+            task["id"] += 1000
+            task["task_id"] += 1000
+        workflow2["tasks"][3]["x"] = 99
+
+        exclusions = json_diff.load_exclusions(EXCLUSION_FILE)
+        tree_dict = json_diff.compute_diff(workflow1, workflow2, exclusions)
+
+        self.assertEqual(list(tree_dict), ["values_changed"])
+        changes = [(change.path, change.old_value, change.new_value) for change in tree_dict["values_changed"]]
+        self.assertEqual(changes, [("root['tasks'][2]['x']", 2, 99)])
+
+
+if __name__ == '__main__':
+    unittest.main()